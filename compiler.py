@@ -67,6 +67,12 @@ def compile():
         f"--add-data={data_file3};{data_file3_sec}",
         "--hidden-import=vispy.ext._bundled.six",
         "--hidden-import=vispy.app.backends._pyside6",
+        # Model backends are imported lazily by the config registry
+        "--hidden-import=catboost",
+        "--hidden-import=sklearn.ensemble",
+        "--hidden-import=sklearn.neural_network",
+        "--hidden-import=myogestic.models.definitions.raulnet_models",
+        "--hidden-import=myoverse.models.definitions.raul_net.online.v16",
         f"--add-data={unity_folder};dist",
     ]
 
@@ -59,8 +59,10 @@ print(inspect.getsource(sklearn_models.predict))
 #
 
 # The `ChangeableParameter` and `UnchangeableParameter` classes are used to define the parameters.
+from myogestic.utils.config import FloatParameter
+
 changeable_parameters = {
-    "C": {"start_value": 1e-4, "end_value": 1e4, "step": 1e-4, "default_value": 1}
+    "C": FloatParameter(start_value=1e-4, end_value=1e4, step=1e-4, default_value=1.0)
 }
 
 unchangeable_parameters = {"penalty": "l2"}
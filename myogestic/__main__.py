@@ -0,0 +1,3 @@
+from myogestic.main import main
+
+main()
@@ -138,64 +138,6 @@ class Ui_MyoGestic(object):
         self.emptyWidget_2 = QWidget()
         self.emptyWidget_2.setObjectName(u"emptyWidget_2")
         self.recordReviewRecordingStackedWidget.addWidget(self.emptyWidget_2)
-        self.reviewRecordingWidget = QWidget()
-        self.reviewRecordingWidget.setObjectName(u"reviewRecordingWidget")
-        self.gridLayout_11 = QGridLayout(self.reviewRecordingWidget)
-        self.gridLayout_11.setObjectName(u"gridLayout_11")
-        self.reviewRecordingGroupBox = QGroupBox(self.reviewRecordingWidget)
-        self.reviewRecordingGroupBox.setObjectName(u"reviewRecordingGroupBox")
-        sizePolicy2.setHeightForWidth(self.reviewRecordingGroupBox.sizePolicy().hasHeightForWidth())
-        self.reviewRecordingGroupBox.setSizePolicy(sizePolicy2)
-        self.gridLayout_10 = QGridLayout(self.reviewRecordingGroupBox)
-        self.gridLayout_10.setObjectName(u"gridLayout_10")
-        self.reviewRecordingTaskLabel = QLabel(self.reviewRecordingGroupBox)
-        self.reviewRecordingTaskLabel.setObjectName(u"reviewRecordingTaskLabel")
-
-        self.gridLayout_10.addWidget(self.reviewRecordingTaskLabel, 0, 1, 1, 1)
-
-        self.reviewRecordingAcceptPushButton = QPushButton(self.reviewRecordingGroupBox)
-        self.reviewRecordingAcceptPushButton.setObjectName(u"reviewRecordingAcceptPushButton")
-        sizePolicy1.setHeightForWidth(self.reviewRecordingAcceptPushButton.sizePolicy().hasHeightForWidth())
-        self.reviewRecordingAcceptPushButton.setSizePolicy(sizePolicy1)
-        self.reviewRecordingAcceptPushButton.setStyleSheet(u"color: rgb(0, 0, 0); background-color: rgb(170, 255, 0);")
-
-        self.gridLayout_10.addWidget(self.reviewRecordingAcceptPushButton, 3, 0, 1, 1)
-
-        self.reviewRecordingLabelLineEdit = QLineEdit(self.reviewRecordingGroupBox)
-        self.reviewRecordingLabelLineEdit.setObjectName(u"reviewRecordingLabelLineEdit")
-        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
-        sizePolicy3.setHorizontalStretch(0)
-        sizePolicy3.setVerticalStretch(0)
-        sizePolicy3.setHeightForWidth(self.reviewRecordingLabelLineEdit.sizePolicy().hasHeightForWidth())
-        self.reviewRecordingLabelLineEdit.setSizePolicy(sizePolicy3)
-
-        self.gridLayout_10.addWidget(self.reviewRecordingLabelLineEdit, 1, 1, 1, 1)
-
-        self.label_2 = QLabel(self.reviewRecordingGroupBox)
-        self.label_2.setObjectName(u"label_2")
-
-        self.gridLayout_10.addWidget(self.label_2, 1, 0, 1, 1)
-
-        self.label_5 = QLabel(self.reviewRecordingGroupBox)
-        self.label_5.setObjectName(u"label_5")
-
-        self.gridLayout_10.addWidget(self.label_5, 0, 0, 1, 1)
-
-        self.reviewRecordingRejectPushButton = QPushButton(self.reviewRecordingGroupBox)
-        self.reviewRecordingRejectPushButton.setObjectName(u"reviewRecordingRejectPushButton")
-        sizePolicy1.setHeightForWidth(self.reviewRecordingRejectPushButton.sizePolicy().hasHeightForWidth())
-        self.reviewRecordingRejectPushButton.setSizePolicy(sizePolicy1)
-        self.reviewRecordingRejectPushButton.setLayoutDirection(Qt.LeftToRight)
-        self.reviewRecordingRejectPushButton.setStyleSheet(u"background-color: rgb(255, 0, 0);\n"
-"color: rgb(0, 0, 0);")
-
-        self.gridLayout_10.addWidget(self.reviewRecordingRejectPushButton, 3, 1, 1, 1)
-
-
-        self.gridLayout_11.addWidget(self.reviewRecordingGroupBox, 0, 0, 1, 1)
-
-        self.recordReviewRecordingStackedWidget.addWidget(self.reviewRecordingWidget)
-
         self.gridLayout_5.addWidget(self.recordReviewRecordingStackedWidget, 1, 0, 1, 1)
 
         self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
@@ -204,11 +146,11 @@ class Ui_MyoGestic(object):
 
         self.recordRecordingGroupBox = QGroupBox(self.recordWidget)
         self.recordRecordingGroupBox.setObjectName(u"recordRecordingGroupBox")
-        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        sizePolicy4.setHorizontalStretch(0)
-        sizePolicy4.setVerticalStretch(0)
-        sizePolicy4.setHeightForWidth(self.recordRecordingGroupBox.sizePolicy().hasHeightForWidth())
-        self.recordRecordingGroupBox.setSizePolicy(sizePolicy4)
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.recordRecordingGroupBox.sizePolicy().hasHeightForWidth())
+        self.recordRecordingGroupBox.setSizePolicy(sizePolicy3)
         self.gridLayout_9 = QGridLayout(self.recordRecordingGroupBox)
         self.gridLayout_9.setObjectName(u"gridLayout_9")
         self.recordKinematicsProgressBar = QProgressBar(self.recordRecordingGroupBox)
@@ -311,11 +253,11 @@ class Ui_MyoGestic(object):
         __qtablewidgetitem2 = QTableWidgetItem()
         self.trainingCreateDatasetSelectedRecordingsTableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem2)
         self.trainingCreateDatasetSelectedRecordingsTableWidget.setObjectName(u"trainingCreateDatasetSelectedRecordingsTableWidget")
-        sizePolicy5 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        sizePolicy5.setHorizontalStretch(0)
-        sizePolicy5.setVerticalStretch(0)
-        sizePolicy5.setHeightForWidth(self.trainingCreateDatasetSelectedRecordingsTableWidget.sizePolicy().hasHeightForWidth())
-        self.trainingCreateDatasetSelectedRecordingsTableWidget.setSizePolicy(sizePolicy5)
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.trainingCreateDatasetSelectedRecordingsTableWidget.sizePolicy().hasHeightForWidth())
+        self.trainingCreateDatasetSelectedRecordingsTableWidget.setSizePolicy(sizePolicy4)
 
         self.gridLayout_13.addWidget(self.trainingCreateDatasetSelectedRecordingsTableWidget, 1, 0, 1, 2)
 
@@ -462,8 +404,8 @@ class Ui_MyoGestic(object):
         self.conformalPredictionSolvingComboBox.addItem("")
         self.conformalPredictionSolvingComboBox.setObjectName(u"conformalPredictionSolvingComboBox")
         self.conformalPredictionSolvingComboBox.setEnabled(False)
-        sizePolicy4.setHeightForWidth(self.conformalPredictionSolvingComboBox.sizePolicy().hasHeightForWidth())
-        self.conformalPredictionSolvingComboBox.setSizePolicy(sizePolicy4)
+        sizePolicy3.setHeightForWidth(self.conformalPredictionSolvingComboBox.sizePolicy().hasHeightForWidth())
+        self.conformalPredictionSolvingComboBox.setSizePolicy(sizePolicy3)
         self.conformalPredictionSolvingComboBox.setEditable(False)
 
         self.gridLayout_32.addWidget(self.conformalPredictionSolvingComboBox, 2, 2, 1, 1)
@@ -536,11 +478,11 @@ class Ui_MyoGestic(object):
         self.gridLayout_16.setObjectName(u"gridLayout_16")
         self.onlineFiltersComboBox = QComboBox(self.onlineFiltersGroupBox)
         self.onlineFiltersComboBox.setObjectName(u"onlineFiltersComboBox")
-        sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
-        sizePolicy6.setHorizontalStretch(0)
-        sizePolicy6.setVerticalStretch(0)
-        sizePolicy6.setHeightForWidth(self.onlineFiltersComboBox.sizePolicy().hasHeightForWidth())
-        self.onlineFiltersComboBox.setSizePolicy(sizePolicy6)
+        sizePolicy5 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        sizePolicy5.setHorizontalStretch(0)
+        sizePolicy5.setVerticalStretch(0)
+        sizePolicy5.setHeightForWidth(self.onlineFiltersComboBox.sizePolicy().hasHeightForWidth())
+        self.onlineFiltersComboBox.setSizePolicy(sizePolicy5)
 
         self.gridLayout_16.addWidget(self.onlineFiltersComboBox, 0, 0, 1, 1)
 
@@ -557,11 +499,11 @@ class Ui_MyoGestic(object):
 
         self.loggingGroupBox = QGroupBox(self.centralwidget)
         self.loggingGroupBox.setObjectName(u"loggingGroupBox")
-        sizePolicy7 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
-        sizePolicy7.setHorizontalStretch(0)
-        sizePolicy7.setVerticalStretch(0)
-        sizePolicy7.setHeightForWidth(self.loggingGroupBox.sizePolicy().hasHeightForWidth())
-        self.loggingGroupBox.setSizePolicy(sizePolicy7)
+        sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+        sizePolicy6.setHorizontalStretch(0)
+        sizePolicy6.setVerticalStretch(0)
+        sizePolicy6.setHeightForWidth(self.loggingGroupBox.sizePolicy().hasHeightForWidth())
+        self.loggingGroupBox.setSizePolicy(sizePolicy6)
         self.loggingGroupBox.setMinimumSize(QSize(0, 200))
         self.gridLayout_14 = QGridLayout(self.loggingGroupBox)
         self.gridLayout_14.setObjectName(u"gridLayout_14")
@@ -607,29 +549,29 @@ class Ui_MyoGestic(object):
         self.horizontalLayout.setContentsMargins(-1, 0, 0, 0)
         self.toggleVispyPlotCheckBox = QCheckBox(self.centralwidget)
         self.toggleVispyPlotCheckBox.setObjectName(u"toggleVispyPlotCheckBox")
-        sizePolicy8 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Maximum)
-        sizePolicy8.setHorizontalStretch(0)
-        sizePolicy8.setVerticalStretch(0)
-        sizePolicy8.setHeightForWidth(self.toggleVispyPlotCheckBox.sizePolicy().hasHeightForWidth())
-        self.toggleVispyPlotCheckBox.setSizePolicy(sizePolicy8)
+        sizePolicy7 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Maximum)
+        sizePolicy7.setHorizontalStretch(0)
+        sizePolicy7.setVerticalStretch(0)
+        sizePolicy7.setHeightForWidth(self.toggleVispyPlotCheckBox.sizePolicy().hasHeightForWidth())
+        self.toggleVispyPlotCheckBox.setSizePolicy(sizePolicy7)
         self.toggleVispyPlotCheckBox.setChecked(True)
 
         self.horizontalLayout.addWidget(self.toggleVispyPlotCheckBox)
 
         self.label_9 = QLabel(self.centralwidget)
         self.label_9.setObjectName(u"label_9")
-        sizePolicy9 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum)
-        sizePolicy9.setHorizontalStretch(0)
-        sizePolicy9.setVerticalStretch(0)
-        sizePolicy9.setHeightForWidth(self.label_9.sizePolicy().hasHeightForWidth())
-        self.label_9.setSizePolicy(sizePolicy9)
+        sizePolicy8 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum)
+        sizePolicy8.setHorizontalStretch(0)
+        sizePolicy8.setVerticalStretch(0)
+        sizePolicy8.setHeightForWidth(self.label_9.sizePolicy().hasHeightForWidth())
+        self.label_9.setSizePolicy(sizePolicy8)
 
         self.horizontalLayout.addWidget(self.label_9)
 
         self.timeShownDoubleSpinBox = QDoubleSpinBox(self.centralwidget)
         self.timeShownDoubleSpinBox.setObjectName(u"timeShownDoubleSpinBox")
-        sizePolicy9.setHeightForWidth(self.timeShownDoubleSpinBox.sizePolicy().hasHeightForWidth())
-        self.timeShownDoubleSpinBox.setSizePolicy(sizePolicy9)
+        sizePolicy8.setHeightForWidth(self.timeShownDoubleSpinBox.sizePolicy().hasHeightForWidth())
+        self.timeShownDoubleSpinBox.setSizePolicy(sizePolicy8)
         self.timeShownDoubleSpinBox.setDecimals(1)
         self.timeShownDoubleSpinBox.setMinimum(0.100000000000000)
         self.timeShownDoubleSpinBox.setMaximum(300.000000000000000)
@@ -642,11 +584,11 @@ class Ui_MyoGestic(object):
 
         self.vispyPlotWidget = BiosignalPlotWidget(self.centralwidget)
         self.vispyPlotWidget.setObjectName(u"vispyPlotWidget")
-        sizePolicy10 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
-        sizePolicy10.setHorizontalStretch(0)
-        sizePolicy10.setVerticalStretch(0)
-        sizePolicy10.setHeightForWidth(self.vispyPlotWidget.sizePolicy().hasHeightForWidth())
-        self.vispyPlotWidget.setSizePolicy(sizePolicy10)
+        sizePolicy9 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
+        sizePolicy9.setHorizontalStretch(0)
+        sizePolicy9.setVerticalStretch(0)
+        sizePolicy9.setHeightForWidth(self.vispyPlotWidget.sizePolicy().hasHeightForWidth())
+        self.vispyPlotWidget.setSizePolicy(sizePolicy9)
         self.vispyPlotWidget.setMinimumSize(QSize(500, 634))
         self.vispyPlotWidget.setSizeIncrement(QSize(0, 0))
 
@@ -664,7 +606,7 @@ class Ui_MyoGestic(object):
 
         self.mindMoveTabWidget.setCurrentIndex(1)
         self.protocolModeStackedWidget.setCurrentIndex(2)
-        self.recordReviewRecordingStackedWidget.setCurrentIndex(1)
+        self.recordReviewRecordingStackedWidget.setCurrentIndex(0)
 
 
         QMetaObject.connectSlotsByName(MyoGestic)
@@ -682,12 +624,6 @@ class Ui_MyoGestic(object):
         self.protocolTrainingRadioButton.setText(QCoreApplication.translate("MyoGestic", u"Training", None))
         self.protocolOnlineRadioButton.setText(QCoreApplication.translate("MyoGestic", u"Online", None))
         self.protocolRecordRadioButton.setText(QCoreApplication.translate("MyoGestic", u"Record", None))
-        self.reviewRecordingGroupBox.setTitle(QCoreApplication.translate("MyoGestic", u"Review Recording", None))
-        self.reviewRecordingTaskLabel.setText(QCoreApplication.translate("MyoGestic", u"Placeholder", None))
-        self.reviewRecordingAcceptPushButton.setText(QCoreApplication.translate("MyoGestic", u"Accept", None))
-        self.label_2.setText(QCoreApplication.translate("MyoGestic", u"Recording Label", None))
-        self.label_5.setText(QCoreApplication.translate("MyoGestic", u"Task", None))
-        self.reviewRecordingRejectPushButton.setText(QCoreApplication.translate("MyoGestic", u"Reject", None))
         self.recordRecordingGroupBox.setTitle(QCoreApplication.translate("MyoGestic", u"Record", None))
         self.label.setText(QCoreApplication.translate("MyoGestic", u"Task", None))
         self.recordRecordPushButton.setText(QCoreApplication.translate("MyoGestic", u"Record", None))
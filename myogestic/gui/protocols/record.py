@@ -6,7 +6,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 import numpy as np
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, Qt
+from PySide6.QtWidgets import (
+    QGridLayout,
+    QGroupBox,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QSizePolicy,
+    QWidget,
+)
 
 from myogestic.gui.widgets.logger import LoggerLevel
 from myogestic.utils.constants import RECORDING_DIR_PATH
@@ -276,6 +285,7 @@ class RecordProtocol(QObject):
         if not self.has_finished_emg:
             return
 
+        self._setup_review_recording_ui()
         self.review_recording_stacked_widget.setCurrentIndex(1)
         self.record_toggle_push_button.setText("Finished Recording")
         self.review_recording_task_label.setText(self.current_task.capitalize())
@@ -396,19 +406,72 @@ class RecordProtocol(QObject):
         )
         self.review_recording_stacked_widget.setCurrentIndex(0)
 
-        self.review_recording_task_label = self.main_window.ui.reviewRecordingTaskLabel
-        self.review_recording_label_line_edit = (
-            self.main_window.ui.reviewRecordingLabelLineEdit
+        # The review page is built on first use in _setup_review_recording_ui
+        self.review_recording_widget: QWidget | None = None
+        self.review_recording_task_label: QLabel | None = None
+        self.review_recording_label_line_edit: QLineEdit | None = None
+        self.review_recording_accept_push_button: QPushButton | None = None
+        self.review_recording_reject_push_button: QPushButton | None = None
+
+        self.use_kinematics_check_box = self.main_window.ui.recordUseKinematicsCheckBox
+
+    def _setup_review_recording_ui(self) -> None:
+        """
+        Builds the review recording page of the stacked widget on first use.
+
+        The page is only shown after a recording has finished, so it is not part of
+        the generated main window and is added to the stacked widget the first time
+        it is needed.
+
+        Returns
+        -------
+        None
+        """
+        if self.review_recording_widget is not None:
+            return
+
+        self.review_recording_widget = QWidget()
+        self.review_recording_widget.setObjectName("reviewRecordingWidget")
+        review_recording_layout = QGridLayout(self.review_recording_widget)
+
+        group_box = QGroupBox("Review Recording", self.review_recording_widget)
+        group_box.setSizePolicy(
+            QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        )
+        group_box_layout = QGridLayout(group_box)
+
+        self.review_recording_task_label = QLabel("Placeholder", group_box)
+        self.review_recording_label_line_edit = QLineEdit(group_box)
+        self.review_recording_label_line_edit.setSizePolicy(
+            QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
         )
 
-        self.review_recording_accept_push_button = (
-            self.main_window.ui.reviewRecordingAcceptPushButton
+        self.review_recording_accept_push_button = QPushButton("Accept", group_box)
+        self.review_recording_accept_push_button.setSizePolicy(
+            QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        )
+        self.review_recording_accept_push_button.setStyleSheet(
+            "color: rgb(0, 0, 0); background-color: rgb(170, 255, 0);"
         )
         self.review_recording_accept_push_button.clicked.connect(self._accept_recording)
 
-        self.review_recording_reject_push_button = (
-            self.main_window.ui.reviewRecordingRejectPushButton
+        self.review_recording_reject_push_button = QPushButton("Reject", group_box)
+        self.review_recording_reject_push_button.setSizePolicy(
+            QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        )
+        self.review_recording_reject_push_button.setLayoutDirection(Qt.LeftToRight)
+        self.review_recording_reject_push_button.setStyleSheet(
+            "background-color: rgb(255, 0, 0);\ncolor: rgb(0, 0, 0);"
         )
         self.review_recording_reject_push_button.clicked.connect(self._reject_recording)
 
-        self.use_kinematics_check_box = self.main_window.ui.recordUseKinematicsCheckBox
+        group_box_layout.addWidget(QLabel("Task", group_box), 0, 0, 1, 1)
+        group_box_layout.addWidget(self.review_recording_task_label, 0, 1, 1, 1)
+        group_box_layout.addWidget(QLabel("Recording Label", group_box), 1, 0, 1, 1)
+        group_box_layout.addWidget(self.review_recording_label_line_edit, 1, 1, 1, 1)
+        group_box_layout.addWidget(self.review_recording_accept_push_button, 3, 0, 1, 1)
+        group_box_layout.addWidget(self.review_recording_reject_push_button, 3, 1, 1, 1)
+
+        review_recording_layout.addWidget(group_box, 0, 0, 1, 1)
+
+        self.review_recording_stacked_widget.addWidget(self.review_recording_widget)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pickle
 from datetime import datetime
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 from PySide6.QtCore import QObject, QThread, Qt, Signal, Slot
@@ -30,7 +30,16 @@ from PySide6.QtWidgets import (
 from myogestic.gui.widgets.logger import LoggerLevel
 
 from myogestic.models.interface import MyoGesticModelInterface
-from myogestic.utils.config import UnchangeableParameter, CONFIG_REGISTRY
+from myogestic.utils.config import (
+    BoolParameter,
+    CategoricalParameter,
+    ChangeableParameter,
+    FloatParameter,
+    IntParameter,
+    StringParameter,
+    UnchangeableParameter,
+    CONFIG_REGISTRY,
+)
 from myogestic.utils.constants import (
     RECORDING_DIR_PATH,
     MODELS_DIR_PATH,
@@ -42,6 +51,67 @@ if TYPE_CHECKING:
     from myogestic.gui.myogestic import MyoGestic
 
 
+def _create_int_parameter_widget(
+    parameter: IntParameter, on_change: Callable
+) -> QSpinBox:
+    widget = QSpinBox()
+    widget.setRange(parameter.start_value, parameter.end_value)
+    widget.setSingleStep(parameter.step)
+    widget.setValue(parameter.default_value)
+    widget.valueChanged.connect(on_change)
+    return widget
+
+
+def _create_float_parameter_widget(
+    parameter: FloatParameter, on_change: Callable
+) -> QDoubleSpinBox:
+    widget = QDoubleSpinBox()
+    widget.setRange(parameter.start_value, parameter.end_value)
+    widget.setSingleStep(parameter.step)
+    widget.setValue(parameter.default_value)
+    widget.valueChanged.connect(on_change)
+    return widget
+
+
+def _create_string_parameter_widget(
+    parameter: StringParameter, on_change: Callable
+) -> QLineEdit:
+    widget = QLineEdit(parameter.default_value)
+    widget.textChanged.connect(on_change)
+    return widget
+
+
+def _create_bool_parameter_widget(
+    parameter: BoolParameter, on_change: Callable
+) -> QCheckBox:
+    widget = QCheckBox()
+    widget.setChecked(parameter.default_value)
+    widget.toggled.connect(on_change)
+    return widget
+
+
+def _create_categorical_parameter_widget(
+    parameter: CategoricalParameter, on_change: Callable
+) -> QComboBox:
+    widget = QComboBox()
+    widget.addItems(parameter.values)
+    widget.setCurrentText(parameter.default_value)
+    widget.currentTextChanged.connect(on_change)
+    return widget
+
+
+# Maps the kind of a changeable parameter to the function creating its widget
+_PARAMETER_WIDGET_FACTORIES: dict[
+    str, Callable[[ChangeableParameter, Callable], QWidget]
+] = {
+    IntParameter.kind: _create_int_parameter_widget,
+    FloatParameter.kind: _create_float_parameter_widget,
+    StringParameter.kind: _create_string_parameter_widget,
+    BoolParameter.kind: _create_bool_parameter_widget,
+    CategoricalParameter.kind: _create_categorical_parameter_widget,
+}
+
+
 class PopupWindowParameters(QDialog):
     def __init__(self, selected_model_name):
         super().__init__()
@@ -59,44 +129,11 @@ class PopupWindowParameters(QDialog):
         ]["changeable"].items():
             horizontal_layout = QHBoxLayout()
             horizontal_layout.addWidget(QLabel(parameter.replace("_", " ").title()))
-            default_value = value["default_value"]
-
-            self.model_changeable_parameters[parameter] = default_value
-
-            if isinstance(default_value, int):
-                parameter_widget = QSpinBox()
-                parameter_widget.setValue(default_value)
-                parameter_widget.setRange(value["start_value"], value["end_value"])
-                parameter_widget.setSingleStep(value["step"])
-                parameter_widget.valueChanged.connect(
-                    partial(self._on_change, parameter)
-                )
-            elif isinstance(default_value, float):
-                parameter_widget = QDoubleSpinBox()
-                parameter_widget.setValue(default_value)
-                parameter_widget.setRange(value["start_value"], value["end_value"])
-                parameter_widget.setSingleStep(value["step"])
-                parameter_widget.valueChanged.connect(
-                    partial(self._on_change, parameter)
-                )
-            elif isinstance(default_value, str):
-                parameter_widget = QLineEdit(default_value)
-                parameter_widget.textChanged.connect(
-                    partial(self._on_change, parameter)
-                )
-            elif isinstance(default_value, bool):
-                parameter_widget = QCheckBox()
-                parameter_widget.setChecked(default_value)
-                parameter_widget.stateChanged.connect(
-                    partial(self._on_change, parameter)
-                )
-            elif isinstance(default_value, list):
-                parameter_widget = QComboBox()
-                parameter_widget.addItems(default_value)
-                parameter_widget.setCurrentText(value["default_value"])
-                parameter_widget.currentTextChanged.connect(
-                    partial(self._on_change, parameter)
-                )
+            self.model_changeable_parameters[parameter] = value.default_value
+
+            parameter_widget = _PARAMETER_WIDGET_FACTORIES[value.kind](
+                value, partial(self._on_change, parameter)
+            )
 
             horizontal_layout.addWidget(parameter_widget)
             layout.addLayout(horizontal_layout)
@@ -234,7 +271,7 @@ class TrainingProtocol(QObject):
         # Model interface
         self.model_interface = None
 
-        self.selected_model_name = list(CONFIG_REGISTRY.models_map.keys())[0]
+        self.selected_model_name = CONFIG_REGISTRY.get_trainable_model_names()[0]
         self.selected_model, self.model_is_classifier = CONFIG_REGISTRY.models_map[
             self.selected_model_name
         ]
@@ -492,7 +529,7 @@ class TrainingProtocol(QObject):
 
         if len(self.model_changeable_parameters) == 0:
             self.model_changeable_parameters = {
-                key: value["default_value"]
+                key: value.default_value
                 for key, value in CONFIG_REGISTRY.models_parameters_map[
                     self.selected_model_name
                 ]["changeable"].items()
@@ -553,7 +590,7 @@ class TrainingProtocol(QObject):
         ]
 
         self.model_changeable_parameters = {
-            key: value["default_value"]
+            key: value.default_value
             for key, value in CONFIG_REGISTRY.models_parameters_map[
                 self.selected_model_name
             ]["changeable"].items()
@@ -665,7 +702,7 @@ class TrainingProtocol(QObject):
         )
         # set the models selection combo box
         self.training_model_selection_combo_box.addItems(
-            list(CONFIG_REGISTRY.models_map.keys())
+            CONFIG_REGISTRY.get_trainable_model_names()
         )
         # connect the models selection combo box to the models selection function
         self.training_model_selection_combo_box.currentIndexChanged.connect(
@@ -1,16 +1,73 @@
 import qdarkstyle
 import sys
+from dataclasses import dataclass, field
 
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QApplication
 
 from myogestic.gui.myogestic import MyoGestic
 
-if __name__ == "__main__":
+
+@dataclass(slots=True, frozen=True)
+class AppConfig:
+    """
+    Application wide Qt settings applied at startup.
+
+    Attributes
+    ----------
+    style : str
+        The Qt style of the application.
+    high_dpi_scale_factor_rounding_policy : Qt.HighDpiScaleFactorRoundingPolicy
+        The rounding policy for fractional HighDPI scale factors.
+    stylesheet : str
+        The stylesheet of the application.
+    """
+
+    style: str = "Fusion"
+    high_dpi_scale_factor_rounding_policy: Qt.HighDpiScaleFactorRoundingPolicy = (
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+    stylesheet: str = field(
+        default_factory=lambda: qdarkstyle.load_stylesheet(qt_api="pyside6")
+    )
+
+
+def _create_application(config: AppConfig) -> QApplication:
+    """
+    Create the QApplication and apply the given configuration to it.
+
+    Parameters
+    ----------
+    config : AppConfig
+        The configuration to apply.
+
+    Returns
+    -------
+    QApplication
+        The configured application.
+    """
+    # The rounding policy has to be set before the application is created.
+    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
+        config.high_dpi_scale_factor_rounding_policy
+    )
+
     app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    app.setStyleSheet(qdarkstyle.load_stylesheet(qt_api="pyside6"))
+    app.setStyle(config.style)
+    app.setStyleSheet(config.stylesheet)
+
+    return app
+
+
+def main() -> None:
+    """Start the MyoGestic application."""
+    app = _create_application(AppConfig())
 
     main_window = MyoGestic()
     main_window.show()
 
     sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import inspect
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
@@ -22,7 +26,76 @@ from PySide6.QtCore import QObject
 
 
 def standardize_data(data: np.ndarray, mean: float, std: float) -> np.ndarray:
-    return (data - mean) / std
+    # The division reuses the buffer of the subtraction instead of allocating again
+    standardized = np.subtract(data, mean)
+    standardized /= std
+    return standardized
+
+
+# Size of the blocks the zarr features are read and reduced in
+_BLOCK_SIZE_BYTES: int = 4 * 1024 * 1024
+
+# Lower bound of the standard deviation used to standardize features
+_STD_EPSILON: float = 1e-8
+
+
+def _copy_with_statistics(
+    source: Any, destination: np.ndarray
+) -> tuple[np.floating, np.floating]:
+    # Copies source into destination block by block while accumulating mean and
+    # variance (Chan et al. parallel update), so the data is only read once.
+    rows_per_block = max(1, _BLOCK_SIZE_BYTES // max(1, destination[:1].nbytes))
+
+    # Read whole zarr chunks so that no chunk has to be decompressed twice
+    chunk_rows = getattr(source, "chunks", None)
+    if chunk_rows is not None:
+        chunk_rows = chunk_rows[0]
+        rows_per_block = max(1, rows_per_block // chunk_rows) * chunk_rows
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for start in range(0, source.shape[0], rows_per_block):
+        block = destination[start : start + rows_per_block]
+        block[...] = source[start : start + rows_per_block]
+
+        block_count = block.size
+        block_mean = block.mean(dtype=np.float64)
+        block_m2 = np.square(np.subtract(block, block_mean, dtype=np.float64)).sum()
+
+        delta = block_mean - mean
+        total = count + block_count
+        mean += delta * block_count / total
+        m2 += block_m2 + delta**2 * count * block_count / total
+        count = total
+
+    return destination.dtype.type(mean), destination.dtype.type(np.sqrt(m2 / count))
+
+
+def _upsample_linear(data: np.ndarray, nr_of_samples: int) -> np.ndarray:
+    # Linear interpolation of all rows at once, equivalent to np.interp per row
+    positions = np.linspace(0, data.shape[1] - 1, nr_of_samples)
+    lower = np.minimum(positions.astype(np.intp), max(data.shape[1] - 2, 0))
+    upper = np.minimum(lower + 1, data.shape[1] - 1)
+    fraction = positions - lower
+    return data[:, lower] * (1 - fraction) + data[:, upper] * fraction
+
+
+@lru_cache(maxsize=None)
+def _accepts_window_size(feature: type) -> bool:
+    parameters = inspect.signature(feature).parameters.values()
+    return any(
+        parameter.name == "window_size"
+        or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+
+def _create_feature_filter(feature_name: str, is_output: bool, window_size: int):
+    feature = CONFIG_REGISTRY.features_map[feature_name]
+    if _accepts_window_size(feature):
+        return feature(is_output=is_output, window_size=window_size)  # noqa
+    return feature(is_output=is_output)  # noqa
 
 
 class MyoGesticDataset(QObject):
@@ -61,7 +134,15 @@ class MyoGesticDataset(QObject):
         self.buffer_size_samples: int = self.buffer_size * self.samples_per_frame
 
         # Online processing
-        self.emg_buffer: list[np.ndarray] = None
+        self.emg_buffer: np.ndarray | None = None
+        self._emg_buffer_slot: int = 0
+        self._emg_buffer_nr_of_frames: int = 0
+        self._bad_channels_key: tuple | None = None
+        self._keep_channels: np.ndarray | None = None
+        self._emg_window: np.ndarray | None = None
+        self._online_sos_filter: SOSFrequencyFilter | None = None
+        self._online_feature_pipeline: list[list] | None = None
+        self._online_feature_pipeline_key: tuple[str, ...] | None = None
         self.dataset_bad_channels: list[int] = None
         self.dataset_mean: float = 0
         self.dataset_std: float = 1
@@ -70,7 +151,7 @@ class MyoGesticDataset(QObject):
         self, dataset: dict[str, dict], selected_features: list[str], file_name: str
     ) -> dict:
         # Accumulate bad channels. Maybe more channels get added between recordings
-        bad_channels: list[int] = []
+        bad_channels: set[int] = set()
 
         emg_data = {}
         ground_truth_data = {}
@@ -84,7 +165,7 @@ class MyoGesticDataset(QObject):
             task_label: str = str(self.task_to_class_map[task.lower()])
 
             recording_bad_channels = recording["bad_channels"]
-            bad_channels.extend(recording_bad_channels)
+            bad_channels.update(recording_bad_channels)
 
             emg = recording["emg"]
             if len(recording_bad_channels) > 0:
@@ -93,37 +174,22 @@ class MyoGesticDataset(QObject):
             if recording["use_kinematics"]:
                 kinematics = recording["kinematics"]
                 # Upsample kinematics 60Hz to 2000 Hz
-                kinematics = np.array(
-                    [
-                        np.interp(
-                            np.linspace(0, 1, emg.shape[1]),
-                            np.linspace(0, 1, kinematics.shape[1]),
-                            k,
-                        )
-                        for k in kinematics
-                    ]
-                )
+                kinematics = _upsample_linear(kinematics, emg.shape[1])
 
                 ground_truth_data[task_label] = kinematics
             else:
-                ground_truth_data[task_label] = np.zeros((9, emg.shape[-1]))
+                # Read-only zero view instead of a 9-row array. The IndexDataFilter of
+                # the ground truth pipeline still copies the 5 selected rows.
+                ground_truth_data[task_label] = np.broadcast_to(
+                    0.0, (9, emg.shape[-1])
+                )
 
             emg_data[task_label] = emg
 
-        emg_filter_pipeline_after_chunking = []
-        for feature in selected_features:
-            try:
-                emg_filter_pipeline_after_chunking.append(
-                    [
-                        CONFIG_REGISTRY.features_map[feature](
-                            is_output=True, window_size=self.buffer_size_samples  # noqa
-                        )
-                    ]
-                )
-            except TypeError:
-                emg_filter_pipeline_after_chunking.append(
-                    [CONFIG_REGISTRY.features_map[feature](is_output=True)]  # noqa
-                )
+        emg_filter_pipeline_after_chunking = [
+            [_create_feature_filter(feature, True, self.buffer_size_samples)]
+            for feature in selected_features
+        ]
 
         dataset = EMGDataset(
             emg_data=emg_data,
@@ -173,18 +239,59 @@ class MyoGesticDataset(QObject):
 
         training_means = {}
         training_stds = {}
-        training_emg = []
 
-        for key in feature_keys:
-            emg_per_key = dataset["training"]["emg"][key][()]
+        # Standardized features are written directly into one preallocated array
+        feature_arrays = [dataset["training"]["emg"][key] for key in feature_keys]
+        feature_widths = [array.shape[1] for array in feature_arrays]
+        training_emg = np.empty(
+            (
+                feature_arrays[0].shape[0],
+                sum(feature_widths),
+                *feature_arrays[0].shape[2:],
+            ),
+            dtype=np.result_type(*[array.dtype for array in feature_arrays], 1.0),
+        )
 
-            training_means[key] = emg_per_key.mean()
-            training_stds[key] = emg_per_key.std()
-            training_emg.append(
-                (emg_per_key - training_means[key]) / training_stds[key]
+        # Each feature fills its own column slice, so the features are read in
+        # parallel threads (zarr decompression and numpy release the GIL)
+        columns = np.cumsum([0, *feature_widths])
+        with ThreadPoolExecutor(
+            max_workers=min(len(feature_keys), os.cpu_count() or 1)
+        ) as executor:
+            statistics = list(
+                executor.map(
+                    lambda index: _copy_with_statistics(
+                        feature_arrays[index],
+                        training_emg[:, columns[index] : columns[index + 1]],
+                    ),
+                    range(len(feature_keys)),
+                )
             )
 
-        training_emg = np.concatenate(training_emg, axis=1)
+        for key, (mean, std) in zip(feature_keys, statistics):
+            training_means[key] = mean
+            # Constant features would otherwise be divided by zero
+            training_stds[key] = max(std, std.dtype.type(_STD_EPSILON))
+
+        # Standardize all features with broadcast operations over the training array
+        statistics_shape = (-1,) + (1,) * (training_emg.ndim - 2)
+        feature_means = np.array(
+            [training_means[key] for key in feature_keys], dtype=training_emg.dtype
+        )
+        feature_stds = np.array(
+            [training_stds[key] for key in feature_keys], dtype=training_emg.dtype
+        )
+        means = np.repeat(feature_means, feature_widths).reshape(statistics_shape)
+        inverse_stds = np.reciprocal(
+            np.repeat(feature_stds, feature_widths)
+        ).reshape(statistics_shape)
+
+        # Both operations are applied per block while it is still in cache
+        rows_per_block = max(1, _BLOCK_SIZE_BYTES // max(1, training_emg[:1].nbytes))
+        for start in range(0, training_emg.shape[0], rows_per_block):
+            block = training_emg[start : start + rows_per_block]
+            np.subtract(block, means, out=block)
+            np.multiply(block, inverse_stds, out=block)
 
         print("Dataset created")
 
@@ -194,7 +301,7 @@ class MyoGesticDataset(QObject):
             "kinematics": training_kinematics,
             "mean": training_means,
             "std": training_stds,
-            "bad_channels": list(set(bad_channels)),
+            "bad_channels": sorted(bad_channels),
             "selected_features": selected_features,
             "device_information": self.device_information,
             "zarr_file_path": file_name + ".zarr",
@@ -203,15 +310,63 @@ class MyoGesticDataset(QObject):
     def preprocess_data(
         self, data: np.ndarray, bad_channels: list[int], selected_features
     ) -> np.ndarray:
-        self.emg_buffer.append(data)
-        if len(self.emg_buffer) > self.buffer_size:
-            self.emg_buffer.pop(0)
+        frame_length = data.shape[-1]
+        window_length = frame_length * self.buffer_size
+        buffer_shape = (*data.shape[:-1], 2 * window_length)
+        if (
+            self.emg_buffer is None
+            or self.emg_buffer.shape != buffer_shape
+            or self.emg_buffer.dtype != data.dtype
+        ):
+            self.emg_buffer = np.empty(buffer_shape, dtype=data.dtype)
+            self._emg_buffer_slot = 0
+            self._emg_buffer_nr_of_frames = 0
+
+        # Every frame is written twice, one window length apart, so the last
+        # buffer_size frames are always one contiguous slice of the buffer
+        start = self._emg_buffer_slot * frame_length
+        self.emg_buffer[..., start : start + frame_length] = data
+        self.emg_buffer[
+            ..., start + window_length : start + window_length + frame_length
+        ] = data
+        self._emg_buffer_slot = (self._emg_buffer_slot + 1) % self.buffer_size
+        self._emg_buffer_nr_of_frames = min(
+            self._emg_buffer_nr_of_frames + 1, self.buffer_size
+        )
 
-            frame_data = np.concatenate(self.emg_buffer, axis=-1)[None]
+        if self._emg_buffer_nr_of_frames == self.buffer_size:
+            start = self._emg_buffer_slot * frame_length
+            frame_data = self.emg_buffer[..., start : start + window_length][None]
+
+            # The channels to keep only change when the bad channels change
+            bad_channels_key = (tuple(bad_channels), frame_data.shape[1])
+            if bad_channels_key != self._bad_channels_key:
+                self._bad_channels_key = bad_channels_key
+                removed_channels = set(bad_channels) | set(self.dataset_bad_channels)
+                self._keep_channels = (
+                    np.array(
+                        [
+                            channel
+                            for channel in range(frame_data.shape[1])
+                            if channel not in removed_channels
+                        ],
+                        dtype=np.intp,
+                    )
+                    if removed_channels
+                    else None
+                )
 
-            bad_channels = list(set(bad_channels + self.dataset_bad_channels))
-            if len(bad_channels) > 0:
-                frame_data = np.delete(frame_data, bad_channels, axis=2)
+            if self._keep_channels is not None:
+                window_shape = (1, len(self._keep_channels), *frame_data.shape[2:])
+                if (
+                    self._emg_window is None
+                    or self._emg_window.shape != window_shape
+                    or self._emg_window.dtype != frame_data.dtype
+                ):
+                    self._emg_window = np.empty(window_shape, dtype=frame_data.dtype)
+                frame_data = np.take(
+                    frame_data, self._keep_channels, axis=1, out=self._emg_window
+                )
 
             frame_data = EMGData(
                 input_data=frame_data,
@@ -219,47 +374,11 @@ class MyoGesticDataset(QObject):
             )
 
             frame_data.apply_filter(
-                SOSFrequencyFilter(
-                    sos_filter_coefficients=butter(
-                        4,
-                        (47, 53),
-                        "bandstop",
-                        output="sos",
-                        fs=self.sampling_frequency,
-                    ),
-                    name="SOSFilter",
-                ),
-                representation_to_filter="Input",
+                self._online_sos_filter, representation_to_filter="Input"
             )
 
-            emg_filters = []
-            for feature in selected_features:
-                try:
-                    emg_filters.append(
-                        CONFIG_REGISTRY.features_map[feature](
-                            is_output=False,
-                            window_size=self.buffer_size_samples,  # noqa
-                        )
-                    )
-                except TypeError:
-                    emg_filters.append(
-                        CONFIG_REGISTRY.features_map[feature](is_output=False)
-                    )  # noqa
-
             frame_data.apply_filter_pipeline(
-                [
-                    [
-                        emg_filter,  # noqa
-                        ApplyFunctionFilter(
-                            is_output=True,
-                            function=standardize_data,
-                            mean=self.dataset_mean[feature],
-                            std=self.dataset_std[feature],
-                            name=feature,
-                        ),
-                    ]
-                    for feature, emg_filter in zip(selected_features, emg_filters)
-                ],
+                self._get_online_feature_pipeline(selected_features),
                 representations_to_filter=["SOSFilter"] * len(selected_features),
             )
 
@@ -273,4 +392,41 @@ class MyoGesticDataset(QObject):
         self.dataset_bad_channels = dataset_information["bad_channels"]
         self.dataset_mean = dataset_information["mean"]
         self.dataset_std = dataset_information["std"]
-        self.emg_buffer: list[np.ndarray] = []
+        self.emg_buffer = None
+        self._bad_channels_key = None
+        self._keep_channels = None
+        self._emg_window = None
+
+        # The filters only depend on the dataset, so they are built once per session
+        self._online_sos_filter = SOSFrequencyFilter(
+            sos_filter_coefficients=butter(
+                4,
+                (47, 53),
+                "bandstop",
+                output="sos",
+                fs=self.sampling_frequency,
+            ),
+            name="SOSFilter",
+        )
+        self._online_feature_pipeline = None
+        self._online_feature_pipeline_key = None
+
+    def _get_online_feature_pipeline(self, selected_features: list[str]) -> list[list]:
+        selected_features_key = tuple(selected_features)
+        if self._online_feature_pipeline_key != selected_features_key:
+            self._online_feature_pipeline_key = selected_features_key
+            self._online_feature_pipeline = [
+                [
+                    _create_feature_filter(feature, False, self.buffer_size_samples),
+                    ApplyFunctionFilter(
+                        is_output=True,
+                        function=standardize_data,
+                        mean=self.dataset_mean[feature],
+                        std=self.dataset_std[feature],
+                        name=feature,
+                    ),
+                ]
+                for feature in selected_features
+            ]
+
+        return self._online_feature_pipeline
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pickle
+from collections import deque
 from typing import Any, TYPE_CHECKING, Union, Optional
 
 import numpy as np
@@ -18,7 +19,8 @@ class MyoGesticModel(QObject):
     def __init__(self, logger: CustomLogger, parent: QObject | None = None) -> None:
         super().__init__(parent)
 
-        self.past_predictions = []
+        # Window of past predictions the real-time filters are applied on
+        self.past_predictions: deque = deque(maxlen=555)
 
         self.model_params = None
         self.model_name = None
@@ -119,14 +121,12 @@ class MyoGesticModel(QObject):
             )
         else:
             self.past_predictions.append(prediction)
-            if len(self.past_predictions) > 555:
-                self.past_predictions.pop(0)
-
+            if len(self.past_predictions) == self.past_predictions.maxlen:
                 # real-time savitzky-golay filter
                 # print(selected_real_time_filter)
                 prediction = CONFIG_REGISTRY.real_time_filters_map[
                     selected_real_time_filter
-                ](self.past_predictions)
+                ](list(self.past_predictions))
                 # prediction =
                 prediction = list(prediction[-1])
 
@@ -2,13 +2,17 @@
 This module contains the functions to save, load, train and predict using CatBoost models.
 """
 
-from typing import Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
 
 import numpy as np
-from catboost.core import _CatBoostBase
 
 from myogestic.gui.widgets.logger import CustomLogger
 
+if TYPE_CHECKING:
+    from catboost.core import _CatBoostBase
+
 
 def save(model_path: str, model: _CatBoostBase) -> str:
     """
@@ -1,9 +1,12 @@
-import copy
-from typing import TypedDict, Union, Dict, Type, Callable, Any, Literal, Optional
+import ctypes
+import importlib
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Union, Dict, Type, Callable, Any, Literal, Optional
 
 import numpy as np
-from catboost import CatBoostClassifier, CatBoostRegressor
-from catboost.utils import get_gpu_device_count
 from myoverse.datasets.filters._template import FilterBaseClass  # noqa
 from myoverse.datasets.filters.generic import IdentityFilter
 from myoverse.datasets.filters.temporal import (
@@ -15,40 +18,149 @@ from myoverse.datasets.filters.temporal import (
     ZCFilter,
     SSCFilter,
 )
-from myoverse.models.definitions.raul_net.online.v16 import RaulNetV16
 from scipy.ndimage import gaussian_filter
 from scipy.signal import savgol_filter
-from sklearn.ensemble import AdaBoostClassifier
-from sklearn.gaussian_process import GaussianProcessClassifier
 from sklearn.linear_model import LinearRegression
-from sklearn.neural_network import MLPClassifier
 
-from myogestic.models.definitions import sklearn_models, catboost_models, raulnet_models
+from myogestic.models.definitions import sklearn_models, catboost_models
 
 
-class IntParameter(TypedDict):
+@lru_cache(maxsize=1)
+def _get_gpu_device_count() -> int:
+    """
+    Get the number of CUDA devices without initializing a deep learning backend.
+
+    PyTorch is only asked if it has already been imported. Otherwise the CUDA driver
+    is queried directly, which avoids the cost of creating a CatBoost or PyTorch CUDA
+    context just to count devices.
+
+    Returns
+    -------
+    int
+        The number of CUDA devices, 0 if no driver or device is available.
+    """
+    if "torch" in sys.modules:
+        return sys.modules["torch"].cuda.device_count()
+
+    for library_name in ("libcuda.so.1", "libcuda.so", "nvcuda.dll"):
+        try:
+            cuda = ctypes.CDLL(library_name)
+        except OSError:
+            continue
+
+        device_count = ctypes.c_int(0)
+        if cuda.cuInit(0) != 0 or cuda.cuDeviceGetCount(ctypes.byref(device_count)):
+            return 0
+        return device_count.value
+
+    return 0
+
+
+_HAS_GPU: bool = _get_gpu_device_count() > 0
+_TASK_TYPE: Literal["GPU", "CPU"] = "GPU" if _HAS_GPU else "CPU"
+
+
+@lru_cache(maxsize=1)
+def _is_torch_cuda_available() -> bool:
+    """
+    Check if PyTorch can use CUDA.
+
+    PyTorch is only imported if the CUDA driver reports a device, so CPU-only machines
+    do not pay for the import.
+
+    Returns
+    -------
+    bool
+        Whether torch.cuda.is_available() is True.
+    """
+    return _HAS_GPU and importlib.import_module("torch").cuda.is_available()
+
+
+class _LazyImport:
+    """
+    Callable stand-in for an attribute of a module that is imported on first use.
+
+    Heavy backends (PyTorch, CatBoost, ...) are only imported when the registered
+    model or function is actually called.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the module to import.
+    attribute_name : str
+        The name of the attribute to get from the module.
+    """
+
+    __slots__ = ("module_name", "attribute_name", "_attribute")
+
+    def __init__(self, module_name: str, attribute_name: str):
+        self.module_name = module_name
+        self.attribute_name = attribute_name
+        self._attribute = None
+
+    def resolve(self) -> Any:
+        """
+        Import the module and return the attribute.
+
+        Returns
+        -------
+        Any
+            The attribute of the module.
+        """
+        if self._attribute is None:
+            self._attribute = getattr(
+                importlib.import_module(self.module_name), self.attribute_name
+            )
+        return self._attribute
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.module_name!r}, {self.attribute_name!r})"
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class IntParameter:
+    kind: ClassVar[str] = "int"
+
     start_value: int
     end_value: int
     step: int
     default_value: int
 
 
-class FloatParameter(TypedDict):
+@dataclass(slots=True, frozen=True)
+class FloatParameter:
+    kind: ClassVar[str] = "float"
+
     start_value: float
     end_value: float
     step: float
     default_value: float
 
 
-class StringParameter(TypedDict):
+@dataclass(slots=True, frozen=True)
+class StringParameter:
+    kind: ClassVar[str] = "str"
+
     default_value: str
 
 
-class BoolParameter(TypedDict):
+@dataclass(slots=True, frozen=True)
+class BoolParameter:
+    kind: ClassVar[str] = "bool"
+
     default_value: bool
 
 
-class CategoricalParameter(TypedDict):
+@dataclass(slots=True, frozen=True)
+class CategoricalParameter:
+    kind: ClassVar[str] = "categorical"
+
     values: list[str]
     default_value: str
 
@@ -58,6 +170,77 @@ ChangeableParameter = Union[
 ]
 UnchangeableParameter = Union[int, float, str, bool, list[str], None]
 
+_CHANGEABLE_PARAMETER_TYPES = (
+    IntParameter,
+    FloatParameter,
+    StringParameter,
+    BoolParameter,
+    CategoricalParameter,
+)
+
+
+def _to_changeable_parameter(
+    model_name: str, parameter_name: str, parameter: Any
+) -> ChangeableParameter:
+    """
+    Validate a changeable parameter, converting the legacy dictionary form.
+
+    Parameters
+    ----------
+    model_name : str
+        The name of the model the parameter belongs to.
+    parameter_name : str
+        The name of the parameter.
+    parameter : Any
+        A changeable parameter or a dictionary with the fields of one.
+
+    Returns
+    -------
+    ChangeableParameter
+        The changeable parameter.
+
+    Raises
+    ------
+    TypeError
+        If the parameter cannot be converted to a changeable parameter.
+    """
+    if isinstance(parameter, _CHANGEABLE_PARAMETER_TYPES):
+        return parameter
+
+    if isinstance(parameter, dict):
+        default_value = parameter.get("default_value")
+        if "values" in parameter:
+            parameter_type = CategoricalParameter
+        elif "start_value" in parameter:
+            parameter_type = (
+                FloatParameter
+                if any(isinstance(value, float) for value in parameter.values())
+                else IntParameter
+            )
+        elif isinstance(default_value, bool):
+            parameter_type = BoolParameter
+        elif isinstance(default_value, str):
+            parameter_type = StringParameter
+        elif isinstance(default_value, list) and default_value:
+            # Categorical parameters used to list their values as the default value
+            return CategoricalParameter(
+                values=default_value, default_value=default_value[0]
+            )
+        else:
+            parameter_type = None
+
+        if parameter_type is not None:
+            try:
+                return parameter_type(**parameter)
+            except TypeError:
+                pass
+
+    raise TypeError(
+        f'Changeable parameter "{parameter_name}" of model "{model_name}" must be one '
+        f"of {', '.join(t.__name__ for t in _CHANGEABLE_PARAMETER_TYPES)}, "
+        f"got {parameter!r}."
+    )
+
 
 class Registry:
     """
@@ -71,8 +254,10 @@ class Registry:
         A dictionary mapping model names to dictionaries of functions to save, load and train the model.
     models_parameters_map : dict[str, dict[Literal["changeable", "unchangeable"], Union[ChangeableParameter, UnchangeableParameter]]]
         A dictionary mapping model names to dictionaries of changeable and unchangeable parameters.
-    features_map : dict[str, FilterBaseClass]
-        A dictionary mapping feature names to filters or partial functions.
+    models_requiring_cuda : set[str]
+        The names of the models that can only be trained with a CUDA device.
+    features_map : MappingProxyType[str, Type[FilterBaseClass]]
+        A read-only mapping of feature names to filters or partial functions. Use `register_feature` to add features.
     """
 
     def __init__(self):
@@ -87,8 +272,12 @@ class Registry:
                 Union[ChangeableParameter, UnchangeableParameter],
             ],
         ] = {}
+        self.models_requiring_cuda: set[str] = set()
 
-        self.features_map: Dict[str, Type[FilterBaseClass]] = {}
+        self._features_map: Dict[str, Type[FilterBaseClass]] = {}
+        self.features_map: MappingProxyType[str, Type[FilterBaseClass]] = (
+            MappingProxyType(self._features_map)
+        )
 
         self.real_time_filters_map: Dict[str, callable] = {}
 
@@ -105,6 +294,7 @@ class Registry:
         predict_function: Callable,
         changeable_parameters: Optional[Dict[str, ChangeableParameter]] = None,
         unchangeable_parameters: Optional[Dict[str, UnchangeableParameter]] = None,
+        requires_cuda: bool = False,
     ):
         """
         Register a model in the registry.
@@ -116,7 +306,7 @@ class Registry:
         model_name : str
             The name of the model.
         model_class : type
-            The class of the model.
+            The class of the model or any callable returning a model instance when called with the model parameters.
         is_classifier : bool
             Whether the model is a classifier.
         save_function : callable
@@ -131,17 +321,29 @@ class Registry:
             The changeable parameters of the model, by default None.
         unchangeable_parameters : dict[str, UnchangeableParameter], optional
             The unchangeable parameters of the model, by default None.
+        requires_cuda : bool, optional
+            Whether the model can only be trained with a CUDA device, by default False.
+            Such models can still be loaded without one.
 
         Raises
         ------
         ValueError
             If the model is already registered.
+        TypeError
+            If a changeable parameter is not a changeable parameter type.
         """
         if model_name in self.models_map:
             raise ValueError(
                 f'Model "{model_name}" is already registered. Please choose a different name.'
             )
 
+        changeable_parameters = {
+            parameter_name: _to_changeable_parameter(
+                model_name, parameter_name, parameter
+            )
+            for parameter_name, parameter in (changeable_parameters or {}).items()
+        }
+
         self.models_map[model_name] = (model_class, is_classifier)
 
         self.models_functions_map[model_name] = {
@@ -152,10 +354,31 @@ class Registry:
         }
 
         self.models_parameters_map[model_name] = {
-            "changeable": changeable_parameters or {},
+            "changeable": changeable_parameters,
             "unchangeable": unchangeable_parameters or {},
         }
 
+        if requires_cuda:
+            self.models_requiring_cuda.add(model_name)
+
+    def get_trainable_model_names(self) -> list[str]:
+        """
+        Get the names of the models that can be trained on this machine.
+
+        Models requiring CUDA are left out if PyTorch cannot use a CUDA device.
+
+        Returns
+        -------
+        list[str]
+            The names of the trainable models in registration order.
+        """
+        return [
+            model_name
+            for model_name in self.models_map
+            if model_name not in self.models_requiring_cuda
+            or _is_torch_cuda_available()
+        ]
+
     def register_feature(self, feature_name: str, feature: Type[FilterBaseClass]):
         """
         Register a feature in the registry.
@@ -181,7 +404,7 @@ class Registry:
 
         feature.name = feature_name
 
-        self.features_map[feature_name] = copy.deepcopy(feature)
+        self._features_map[feature_name] = feature
 
     def register_real_time_filter(self, filter_name: str, filter_function: callable):
         """
@@ -194,7 +417,8 @@ class Registry:
         filter_name : str
             The name of the filter.
         filter_function : callable
-            The filter function.
+            The filter function. It is called with the list of past predictions,
+            oldest first.
 
         Raises
         ------
@@ -209,6 +433,32 @@ class Registry:
         self.real_time_filters_map[filter_name] = filter_function
 
 
+# Parameters shared by all RaulNet registrations
+_RAULNET_PARAMETERS: Dict[str, UnchangeableParameter] = {
+    "learning_rate": 1e-4,
+    "nr_of_input_channels": 1,
+    "input_length__samples": 360,
+    "nr_of_electrode_grids": 1,
+    "nr_of_electrodes_per_grid": 32,
+    "cnn_encoder_channels": (64, 32, 32),
+    "mlp_encoder_channels": (128, 128),
+    "event_search_kernel_length": 31,
+    "event_search_kernel_stride": 8,
+}
+
+# Features available by default
+_DEFAULT_FEATURES: tuple[tuple[str, Type[FilterBaseClass]], ...] = (
+    ("Root Mean Square", RMSFilter),
+    ("Mean Absolute Value", MAVFilter),
+    ("Integrated Absolute Value", IAVFilter),
+    ("Variance", VARFilter),
+    ("Waveform Length", WFLFilter),
+    ("Zero Crossings", ZCFilter),
+    ("Slope Sign Change", SSCFilter),
+    ("Identity", IdentityFilter),
+)
+
+
 # ------------------------------------------------------------------------------
 if "CONFIG_REGISTRY" not in globals():
     CONFIG_REGISTRY = Registry()
@@ -220,105 +470,92 @@ def _set_config_registry() -> None:
 
     """
     # Register models
+    # RaulNet can only be trained with CUDA but loads on any machine. PyTorch is
+    # only imported once a model is created.
+    raulnet_v16 = _LazyImport(
+        "myoverse.models.definitions.raul_net.online.v16", "RaulNetV16"
+    )
+    raulnet_models = "myogestic.models.definitions.raulnet_models"
+
     CONFIG_REGISTRY.register_model(
         "RaulNet Regressor",
-        RaulNetV16,
+        raulnet_v16,
         False,
-        raulnet_models.save,
-        raulnet_models.load,
-        raulnet_models.train,
-        raulnet_models.predict,
-        unchangeable_parameters={
-            "learning_rate": 1e-4,
-            "nr_of_input_channels": 1,
-            "input_length__samples": 360,
-            "nr_of_outputs": 5,
-            "nr_of_electrode_grids": 1,
-            "nr_of_electrodes_per_grid": 32,
-            "cnn_encoder_channels": (64, 32, 32),
-            "mlp_encoder_channels": (128, 128),
-            "event_search_kernel_length": 31,
-            "event_search_kernel_stride": 8,
-        },
+        _LazyImport(raulnet_models, "save"),
+        _LazyImport(raulnet_models, "load"),
+        _LazyImport(raulnet_models, "train"),
+        _LazyImport(raulnet_models, "predict"),
+        unchangeable_parameters={**_RAULNET_PARAMETERS, "nr_of_outputs": 5},
+        requires_cuda=True,
     )
 
     CONFIG_REGISTRY.register_model(
         "RaulNet Regressor per Finger",
-        RaulNetV16,
+        raulnet_v16,
         False,
-        raulnet_models.save_per_finger,
-        raulnet_models.load_per_finger,
-        raulnet_models.train_per_finger,
-        raulnet_models.predict_per_finger,
-        unchangeable_parameters={
-            "learning_rate": 1e-4,
-            "nr_of_input_channels": 1,
-            "input_length__samples": 360,
-            "nr_of_outputs": 1,
-            "nr_of_electrode_grids": 1,
-            "nr_of_electrodes_per_grid": 32,
-            "cnn_encoder_channels": (64, 32, 32),
-            "mlp_encoder_channels": (128, 128),
-            "event_search_kernel_length": 31,
-            "event_search_kernel_stride": 8,
-        },
+        _LazyImport(raulnet_models, "save_per_finger"),
+        _LazyImport(raulnet_models, "load_per_finger"),
+        _LazyImport(raulnet_models, "train_per_finger"),
+        _LazyImport(raulnet_models, "predict_per_finger"),
+        unchangeable_parameters={**_RAULNET_PARAMETERS, "nr_of_outputs": 1},
+        requires_cuda=True,
     )
 
     CONFIG_REGISTRY.register_model(
         "CatBoost Classifier",
-        CatBoostClassifier,
+        _LazyImport("catboost", "CatBoostClassifier"),
         True,
         catboost_models.save,
         catboost_models.load,
         catboost_models.train,
         catboost_models.predict,
         {
-            "iterations": {
-                "start_value": 10,
-                "end_value": 10000,
-                "step": 100,
-                "default_value": 1000,
-            },
-            "l2_leaf_reg": {
-                "start_value": 1,
-                "end_value": 10,
-                "step": 1,
-                "default_value": 5,
-            },
-            "border_count": {
-                "start_value": 1,
-                "end_value": 255,
-                "step": 1,
-                "default_value": 254,
-            },
+            "iterations": IntParameter(
+                start_value=10,
+                end_value=10000,
+                step=100,
+                default_value=1000,
+            ),
+            "l2_leaf_reg": IntParameter(
+                start_value=1,
+                end_value=10,
+                step=1,
+                default_value=5,
+            ),
+            "border_count": IntParameter(
+                start_value=1,
+                end_value=255,
+                step=1,
+                default_value=254,
+            ),
         },
         {
-            "task_type": "GPU" if get_gpu_device_count() > 0 else "CPU",
+            "task_type": _TASK_TYPE,
             "train_dir": None,
         },
     )
 
     CONFIG_REGISTRY.register_model(
         "AdaBoost Classifier",
-        AdaBoostClassifier,
+        _LazyImport("sklearn.ensemble", "AdaBoostClassifier"),
         True,
         sklearn_models.save,
         sklearn_models.load,
         sklearn_models.train,
         sklearn_models.predict,
         {
-            "n_estimators": {
-                "start_value": 10,
-                "end_value": 1000,
-                "step": 10,
-                "default_value": 100,
-            },
-            "learning_rate": {
-                "start_value": 0.1,
-                "end_value": 1,
-                "step": 0.1,
-                "default_value": 0.1,
-            },
+            "n_estimators": IntParameter(
+                start_value=10,
+                end_value=1000,
+                step=10,
+                default_value=100,
+            ),
+            "learning_rate": FloatParameter(
+                start_value=0.1,
+                end_value=1.0,
+                step=0.1,
+                default_value=0.1,
+            ),
         },
     )
 
@@ -335,38 +572,32 @@ def _set_config_registry() -> None:
 
     CONFIG_REGISTRY.register_model(
         "MLP Classifier",
-        MLPClassifier,
+        _LazyImport("sklearn.neural_network", "MLPClassifier"),
         True,
         sklearn_models.save,
         sklearn_models.load,
         sklearn_models.train,
         sklearn_models.predict,
         {
-            "hidden_layer_sizes": {
-                "start_value": 10,
-                "end_value": 1000,
-                "step": 10,
-                "default_value": 100,
-            },
-            "alpha": {
-                "start_value": 1e-4,
-                "end_value": 1,
-                "step": 1e-4,
-                "default_value": 1e-4,
-            },
+            "hidden_layer_sizes": IntParameter(
+                start_value=10,
+                end_value=1000,
+                step=10,
+                default_value=100,
+            ),
+            "alpha": FloatParameter(
+                start_value=1e-4,
+                end_value=1.0,
+                step=1e-4,
+                default_value=1e-4,
+            ),
         },
         {"activation": "relu"},
     )
 
     # Register features
-    CONFIG_REGISTRY.register_feature("Root Mean Square", RMSFilter)
-    CONFIG_REGISTRY.register_feature("Mean Absolute Value", MAVFilter)
-    CONFIG_REGISTRY.register_feature("Integrated Absolute Value", IAVFilter)
-    CONFIG_REGISTRY.register_feature("Variance", VARFilter)
-    CONFIG_REGISTRY.register_feature("Waveform Length", WFLFilter)
-    CONFIG_REGISTRY.register_feature("Zero Crossings", ZCFilter)
-    CONFIG_REGISTRY.register_feature("Slope Sign Change", SSCFilter)
-    CONFIG_REGISTRY.register_feature("Identity", IdentityFilter)
+    for feature_name, feature in _DEFAULT_FEATURES:
+        CONFIG_REGISTRY.register_feature(feature_name, feature)
 
     # Register real-time filters
     CONFIG_REGISTRY.register_real_time_filter("Identity", lambda x: x)